@@ -1,20 +1,21 @@
 import pandas as pd
 
-df = pd.read_csv('extra-data/montana-events.csv')
+# only the medal and athlete name columns are used below
+df = pd.read_csv('extra-data/montana-events.csv', usecols=['Medal', 'As'])
 
 df['Medal'] = df['Medal'].str.strip()
 
-medals = df[df['Medal'].isin(['Gold', 'Silver', 'Bronze'])]
+medals = df[df['Medal'].isin(['Gold', 'Silver', 'Bronze'])].copy()
+# categorical medals: value_counts/crosstab count integer codes in this order
+medals['Medal'] = pd.Categorical(medals['Medal'], categories=['Gold', 'Silver', 'Bronze'])
 
-medal_counts = medals['Medal'].value_counts().reindex(['Gold', 'Silver', 'Bronze'], fill_value=0).reset_index()
+medal_counts = medals['Medal'].value_counts(sort=False).reindex(['Gold', 'Silver', 'Bronze'], fill_value=0).reset_index()
 medal_counts.columns = ['medal', 'number']
 medal_counts['medal'] = medal_counts['medal'].str.lower()
 medal_counts.to_csv('extra-data/medal-counts.csv', index=False)
 
 athlete_medals = (
-    medals.groupby('As')['Medal']
-    .value_counts()
-    .unstack(fill_value=0)
+    pd.crosstab(medals['As'], medals['Medal'])
     .reindex(columns=['Gold', 'Silver', 'Bronze'], fill_value=0)
     .reset_index()
     .rename(columns={'As': 'name', 'Gold': 'gold', 'Silver': 'silver', 'Bronze': 'bronze'})
@@ -1,12 +1,23 @@
+import asyncio
 import csv
+import gzip
+import hashlib
+import io
 import os
 import re
+import sys
 import time
-import urllib.request
+import unicodedata
 import urllib.parse
-import urllib.error
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from html.parser import HTMLParser
+from operator import itemgetter
+
+import aiohttp
+import pandas as pd
+from aiolimiter import AsyncLimiter
 
 # config
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -14,11 +25,27 @@ INPUT_DIR  = os.path.join(SCRIPT_DIR, "input-data")
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "output-data")      # already-generated files
 WINTER_DIR = os.path.join(SCRIPT_DIR, "winter-output-data")
 SUMMER_DIR = os.path.join(SCRIPT_DIR, "summer-output-data")
-
-# pauses to avoid rate limiting
-REQUEST_DELAY = 4.0
+CACHE_DIR  = os.path.join(SCRIPT_DIR, ".http-cache")          # gzipped olympedia pages
+CACHE_TTL  = 30 * 24 * 3600   # seconds before a cached page is re-fetched
+REFRESH    = "--refresh" in sys.argv[1:]   # ignore cached pages this run (still re-cached)
+
+MIN_YEAR = 1924   # Winter Olympics began in 1924; exclude earlier games
+# any four-digit year >= MIN_YEAR, so the year cut-off is applied by the regex itself
+_YEAR_RE = r"(?:192[4-9]|19[3-9]\d|[2-9]\d{3})"
+
+# global request budget shared by every concurrent scrape, to avoid rate limiting
+MAX_RATE      = 10     # requests …
+RATE_PERIOD   = 1.0    # … per this many seconds
+REQUEST_DELAY = 4.0    # first back-off after a 429/5xx without a Retry-After header
 MAX_DELAY     = 60.0
 MAX_RETRIES   = 6
+RETRY_STATUSES = {429, 502, 503, 504}   # rate limiting and transient gateway errors
+
+# number of athlete pages fetched concurrently
+SCRAPE_CONCURRENCY = 32
+
+# name searches shorter than this (e.g. a lone initial) cannot identify anyone
+MIN_QUERY_LEN = 2
 
 # ! IMPORTANT:
 # Session cookie – update this if requests start returning 302/login pages.
@@ -75,71 +102,157 @@ class LinkTextParser(HTMLParser):
             self._buf.append(data)
 
 
-_current_delay = REQUEST_DELAY  # module-level, reset on success
+# olympedia's edition and athlete links are flat: <a href="/editions/3">1904 Summer Olympics</a>.
+# Pages stay as raw bytes throughout – the anchors we need are plain ASCII.
+_A_RE = re.compile(rb'<a\b[^>]*\bhref="([^"]+)"[^>]*>([^<]*)</a>', re.I)
+
+
+def _links(html: bytes, prefix: bytes) -> list[tuple[bytes, bytes]]:
+    """
+    (href, text) for every <a> whose href starts with prefix.
+    A single compiled-regex scan covers the flat anchors olympedia uses; if it
+    finds none while such hrefs are on the page, the anchors wrap nested markup
+    and we fall back to the full LinkTextParser.
+    """
+    links = [(href, text.strip()) for href, text in _A_RE.findall(html)
+             if href.startswith(prefix)]
+    if not links and b'href="' + prefix in html:
+        parser = LinkTextParser()
+        parser.feed(html.decode("utf-8", errors="replace"))
+        links = [(href.encode(), text.encode()) for href, text in parser.links
+                 if href.startswith(prefix.decode())]
+    return links
+
+
+# one pass over the raw page picks up both seasons: edition anchors whose text
+# starts "YYYY Winter Olympics" / "YYYY Summer Olympics" → (label, season)
+_EDITION_RE = re.compile(
+    rf'href="/editions/\d+"[^>]*>\s*({_YEAR_RE} (Winter|Summer) Olympics)'.encode())
+_ATHLETE_HREF_RE = re.compile(rb"^/athletes/(\d+)$")
 
 
-def _fetch(url: str) -> str | None:
-    """GET url with exponential back-off on 429. Returns body or None."""
-    global _current_delay
-    delay = _current_delay
+LIMITER = AsyncLimiter(MAX_RATE, RATE_PERIOD)
+
+
+def _retry_after(resp: aiohttp.ClientResponse, fallback: float) -> float:
+    """Seconds to wait before a retry: the server's Retry-After if numeric, else fallback."""
+    try:
+        return min(float(resp.headers.get("Retry-After", "")), MAX_DELAY)
+    except ValueError:
+        return fallback
+
+
+def _cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + ".html.gz")
+
+
+def _cache_get(url: str) -> bytes | None:
+    """Return the cached body for url if present and younger than CACHE_TTL."""
+    if REFRESH:
+        return None
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL:
+            return None
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cache_put(url: str, body: bytes) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(url)
+    tmp  = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)   # atomic, so an interrupted run never leaves a torn entry
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str) -> bytes | None:
+    """
+    GET url under the global rate limit, backing off on 429 and transient 5xx.
+    Returns body or None.
+    Direct (unredirected) 200 responses are cached on disk, so re-runs skip the network.
+    """
+    cached = _cache_get(url)
+    if cached is not None:
+        return cached
+    delay = REQUEST_DELAY
     for attempt in range(1, MAX_RETRIES + 1):
-        time.sleep(delay)
-        req = urllib.request.Request(url, headers=HEADERS)
         try:
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                _current_delay = REQUEST_DELAY   # reset on success
-                return resp.read().decode("utf-8", errors="replace")
-        except urllib.error.HTTPError as exc:
-            if exc.code == 429:
-                delay = min(delay * 2, MAX_DELAY)
-                print(f"  [429] rate-limited, backing off {delay:.0f}s "
-                      f"(attempt {attempt}/{MAX_RETRIES}) → {url}")
-            else:
-                print(f"  [WARN] HTTP {exc.code} for {url}")
-                return None
-        except urllib.error.URLError as exc:
+            async with LIMITER:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as resp:
+                    if resp.status in RETRY_STATUSES:
+                        status = resp.status
+                        wait   = _retry_after(resp, delay)
+                        delay  = min(delay * 2, MAX_DELAY)
+                    elif resp.status >= 400:
+                        print(f"  [WARN] HTTP {resp.status} for {url}")
+                        return None
+                    else:
+                        body = await resp.read()
+                        # only a direct 200 is cached: a redirected page (e.g. the
+                        # login page an expired cookie lands on) must not outlive it
+                        if resp.status == 200 and not resp.history:
+                            _cache_put(url, body)
+                        return body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
             print(f"  [WARN] fetch failed for {url}: {exc}")
             return None
+        print(f"  [{status}] backing off {wait:.0f}s "
+              f"(attempt {attempt}/{MAX_RETRIES}) → {url}")
+        await asyncio.sleep(wait)
     print(f"  [FAIL] max retries exceeded for {url}")
     return None
 
-# check athlete page for Olympics entries of a given season ("Winter" or "Summer")
-def games_from_page(athlete_id: str, season: str) -> list[str] | None:
+# check athlete page for Olympics entries of both seasons with a single fetch
+async def scrape_all_seasons(session: aiohttp.ClientSession,
+                             athlete_id: str) -> dict[str, list[str]] | None:
+    """Return {"Winter": [games…], "Summer": [games…]} for an athlete, or None on failure."""
     url  = f"{BASE_URL}/athletes/{athlete_id}"
-    html = _fetch(url)
+    html = await _fetch(session, url)
     if html is None:
         return None
-    parser = LinkTextParser()
-    parser.feed(html)
-    games = []
-    label = f"{season} Olympics"
-    for href, text in parser.links:
-        # links look like <a href="/editions/3">1904 Summer Olympics</a>
-        if href.startswith("/editions/") and label in text:
-            year_match = re.match(rf"(\d{{4}} {season} Olympics)", text)
-            if year_match and int(year_match.group(1)[:4]) >= MIN_YEAR and year_match.group(1) not in games:
-                games.append(year_match.group(1))
-    return sorted(games)
-
-
-# for athletes without an ID, search by name and check if any results match the season
-def search_and_find_season(used_name: str, season: str) -> list[str] | None:
-    parts = used_name.replace("•", " ").split()
-    if not parts:
+    games: dict[str, set[str]] = {"Winter": set(), "Summer": set()}
+    # links look like <a href="/editions/3">1904 Summer Olympics</a>;
+    # only the matched labels are decoded, never the whole page
+    for label, season in _EDITION_RE.findall(html):
+        games[season.decode()].add(label.decode())
+    return {season: sorted(labels) for season, labels in games.items()}
+
+
+# for athletes without an ID, search by name and scrape the first athlete page that loads
+def _search_query(used_name: str) -> str:
+    """Quick-search query for a used name, or "" if it is too short to find anyone."""
+    # fold accents ("José" → "Jose") by dropping combining marks only, so letters
+    # without an ASCII decomposition ("ø", non-Latin scripts) survive intact
+    query = "".join(c for c in unicodedata.normalize("NFKD", used_name)
+                    if not unicodedata.combining(c))
+    query = " ".join(query.replace("•", " ").split())
+    return query if len(query) >= MIN_QUERY_LEN else ""
+
+
+async def search_and_find_seasons(session: aiohttp.ClientSession,
+                                  used_name: str) -> dict[str, list[str]] | None:
+    query = _search_query(used_name)
+    if not query:
         return None
-    query = urllib.parse.quote_plus(" ".join(parts))
-    url   = f"{BASE_URL}/athletes/quick_search?query={query}"
-    html  = _fetch(url)
+    url   = f"{BASE_URL}/athletes/quick_search?{urllib.parse.urlencode({'query': query})}"
+    html  = await _fetch(session, url)
     if html is None:
         return None
-    parser = LinkTextParser()
-    parser.feed(html)
-    for href, _text in parser.links:
-        m = re.match(r"^/athletes/(\d+)$", href)
+    for href, _text in _links(html, b"/athletes/"):
+        m = _ATHLETE_HREF_RE.match(href)
         if m:
-            games = games_from_page(m.group(1), season)
-            if games is not None:
-                return games
+            aid = m.group(1).decode()
+            if aid in seen_ids:
+                # results.csv already covers this athlete – no page fetch needed
+                return {"Winter": winter_lookup.get(aid, []),
+                        "Summer": summer_lookup.get(aid, [])}
+            seasons = await scrape_all_seasons(session, aid)
+            if seasons is not None:
+                return seasons
     return None
 
 
@@ -147,64 +260,67 @@ def search_and_find_season(used_name: str, season: str) -> list[str] | None:
 with open(os.path.join(INPUT_DIR, "states-list.txt"), encoding="utf-8") as f:
     states_list = [line.strip() for line in f if line.strip()]
 
-# athlete_id -> winter games lookup from results.csv
+# athlete_id -> season games lookups from results.csv
 
 print("Building season-games lookups from results.csv …")
 
 # keep games that are proper Olympics only (not Youth etc.)
-_WINTER_RE = re.compile(r"^\d{4} Winter Olympics$")
-_SUMMER_RE = re.compile(r"^\d{4} Summer Olympics$")
-MIN_YEAR   = 1924   # Winter Olympics began in 1924; exclude earlier games
-
-winter_lookup: dict[str, list[str]] = defaultdict(list)
-summer_lookup: dict[str, list[str]] = defaultdict(list)
-seen_ids: set[str] = set()   # every athlete_id that appears in results.csv
-
-with open(os.path.join(INPUT_DIR, "results.csv"), encoding="utf-8", newline="") as f:
-    for row in csv.DictReader(f):
-        aid   = str(row.get("athlete_id", "")).strip()
-        games = row.get("Games", "").strip()
-        if not aid:
-            continue
-        seen_ids.add(aid)
-        if _WINTER_RE.match(games) and int(games[:4]) >= MIN_YEAR and games not in winter_lookup[aid]:
-            winter_lookup[aid].append(games)
-        if _SUMMER_RE.match(games) and int(games[:4]) >= MIN_YEAR and games not in summer_lookup[aid]:
-            summer_lookup[aid].append(games)
-
-# sort each athlete's game list chronologically
-for aid in winter_lookup:
-    winter_lookup[aid].sort()
-for aid in summer_lookup:
-    summer_lookup[aid].sort()
+_GAMES_RE = rf"^{_YEAR_RE} (Winter|Summer) Olympics$"
+
+
+def load_results(path: str) -> pd.DataFrame:
+    """athlete_id / Games columns of a results CSV, stripped, rows without an ID dropped."""
+    df = pd.read_csv(path, usecols=["athlete_id", "Games"], dtype=str,
+                     keep_default_na=False)
+    df["athlete_id"] = df["athlete_id"].str.strip()
+    df["Games"]      = df["Games"].str.strip()
+    return df[df["athlete_id"] != ""]
 
+
+results  = load_results(os.path.join(INPUT_DIR, "results.csv"))
+seen_ids = set(results["athlete_id"].unique())   # every athlete_id that appears in results.csv
 print(f"  {len(seen_ids):,} unique athlete IDs in results.csv")
-print(f"  {len(winter_lookup):,} athletes with ≥1 Winter Olympics entry")
-print(f"  {len(summer_lookup):,} athletes with ≥1 Summer Olympics entry")
 
 # also load 2024-2026-us-results.csv if present
 _new_results = os.path.join(INPUT_DIR, "2024-2026-us-results.csv")
 if os.path.exists(_new_results):
-    _before = len(seen_ids)
-    with open(_new_results, encoding="utf-8", newline="") as f:
-        for row in csv.DictReader(f):
-            aid   = str(row.get("athlete_id", "")).strip()
-            games = row.get("Games", "").strip()
-            if not aid:
-                continue
-            seen_ids.add(aid)
-            if _WINTER_RE.match(games) and int(games[:4]) >= MIN_YEAR and games not in winter_lookup[aid]:
-                winter_lookup[aid].append(games)
-            if _SUMMER_RE.match(games) and int(games[:4]) >= MIN_YEAR and games not in summer_lookup[aid]:
-                summer_lookup[aid].append(games)
-    for aid in winter_lookup:
-        winter_lookup[aid].sort()
-    for aid in summer_lookup:
-        summer_lookup[aid].sort()
+    _before  = len(seen_ids)
+    _new     = load_results(_new_results)
+    seen_ids.update(_new["athlete_id"].unique())
+    results  = pd.concat([results, _new], ignore_index=True)
     print(f"Merged {_new_results}: +{len(seen_ids) - _before} new athlete IDs")
 else:
     print(f"[INFO] {_new_results} not found – using results.csv only.")
 
+# only a few dozen distinct Games labels exist: as a categorical, the map,
+# de-duplication and sort below work on integer codes, and each label is
+# parsed once; non-Olympics and pre-MIN_YEAR rows get a NaN season
+results["Games"] = results["Games"].astype("category")
+_labels  = pd.Series(results["Games"].cat.categories)
+_season  = dict(zip(_labels, _labels.str.extract(_GAMES_RE, expand=False)))
+# categories are sorted, so sorting by Games up front leaves every athlete's
+# list in chronological order
+results  = (results.assign(season=results["Games"].map(_season))
+            .dropna(subset=["season"])
+            .drop_duplicates(["athlete_id", "Games"])
+            .sort_values("Games", kind="stable"))
+
+
+def season_lookup(season: str) -> dict[str, list[str]]:
+    rows = results[results["season"] == season]
+    lookup: dict[str, list[str]] = {}
+    for aid, games in zip(rows["athlete_id"].tolist(), rows["Games"].tolist()):
+        lookup.setdefault(aid, []).append(games)
+    return lookup
+
+
+winter_lookup = season_lookup("Winter")
+summer_lookup = season_lookup("Summer")
+del results, _labels, _season
+
+print(f"  {len(winter_lookup):,} athletes with ≥1 Winter Olympics entry")
+print(f"  {len(summer_lookup):,} athletes with ≥1 Summer Olympics entry")
+
 def build_output_cache() -> dict[str, dict[str, list[str]]]:
     """
     Read any already-written season output files so we can skip re-scraping
@@ -217,17 +333,17 @@ def build_output_cache() -> dict[str, dict[str, list[str]]]:
     re-attempted by default (their previous scrape may have been a network
     failure).
     """
-    cache: dict[str, dict[str, list[str]]] = {}
+    # accumulate sets while reading; each list is sorted once at the end
+    cache: dict[str, dict[str, set[str] | None]] = {}
 
     def _add(aid: str, season: str, games: list[str]) -> None:
         if aid not in cache:
             cache[aid] = {"Winter": None, "Summer": None}  # None = unseen
         existing = cache[aid][season]
         if existing is None:
-            cache[aid][season] = sorted(games)
+            cache[aid][season] = set(games)
         else:
-            merged = sorted(set(existing) | set(games))
-            cache[aid][season] = merged
+            existing.update(games)
 
     for out_dir, season in ((WINTER_DIR, "Winter"), (SUMMER_DIR, "Summer")):
         # Positive results: athletes that DID compete this season
@@ -251,7 +367,11 @@ def build_output_cache() -> dict[str, dict[str, list[str]]]:
         # cache entry for the other season but not this one — handled implicitly
         # below; nothing explicit to load here for negatives.
 
-    return cache
+    return {
+        aid: {season: None if games is None else sorted(games)
+              for season, games in seasons.items()}
+        for aid, seasons in cache.items()
+    }
 
 
 print("Building output cache from previous runs …")
@@ -272,122 +392,201 @@ def make_out_fields(fieldnames: list[str]) -> list[str]:
     return out
 
 
-def build_out_row(row: dict, games_str: str, out_fields: list[str]) -> dict:
-    out = {k: row.get(k, "") for k in out_fields}
-    out["Games"] = games_str
-    return out
+def out_row_builder(out_fields: list[str]):
+    """
+    Return build(row, games_str) → tuple aligned with out_fields. A single
+    itemgetter call pulls every other column, so no per-row dict is built and
+    the tuples go straight to csv.writer.
+    """
+    games_ix = out_fields.index("Games")
+    others   = itemgetter(*out_fields[:games_ix], *out_fields[games_ix + 1:])
+
+    def build(row: dict, games_str: str) -> tuple:
+        values = others(row)
+        return values[:games_ix] + (games_str,) + values[games_ix:]
+
+    return build
+
+def _scrape_key(row: dict) -> str:
+    """Identity of one scrape: the athlete_id, or the used name for rows without one."""
+    aid = str(row.get("athlete_id", "")).strip()
+    return aid or f"name:{row.get('Used name', '')}"
+
+
+# scrape key → {"Winter": [games…], "Summer": [games…]}, or None if the scrape failed
+_scraped: dict[str, dict[str, list[str]] | None] = {}
+
 
-def classify_athletes(athletes: list[dict], out_fields: list[str],
-                      season: str, lookup: dict,
-                      state_key_fn=None) -> tuple[list, list]:
+def plan_athletes(athletes: list[dict], out_fields: list[str],
+                  season: str, lookup: dict,
+                  state_key_fn=None) -> tuple[list, list]:
     """
+    Resolve every athlete that results.csv or a previous run already covers.
+    Returns (season_rows, needs_scrape); needs_scrape holds (key, row) pairs
+    that materialize() fills in once scrape_missing() has run over every plan.
+
     season       : "Winter" or "Summer"
     lookup       : pre-built {athlete_id: [games]} dict for this season
     state_key_fn : row → string used for by-state grouping.
                    If None, each row gets key "" (used for us-born-elsewhere).
     """
+    build_out_row = out_row_builder(out_fields)
     season_rows   = []   # (key, out_row)
-    no_match_rows = []   # out_row
     needs_scrape  = []
     from_cache    = 0
 
     for row in athletes:
         aid = str(row.get("athlete_id", "")).strip()
+        key = state_key_fn(row) if state_key_fn else ""   # once per row, shared by every branch
         if aid in seen_ids:
             # ID is in results — use pre-built lookup
             games = lookup.get(aid, [])
             if games:
-                key = state_key_fn(row) if state_key_fn else ""
-                season_rows.append(
-                    (key, build_out_row(row, "; ".join(games), out_fields)))
+                season_rows.append((key, build_out_row(row, "; ".join(games))))
             # else: has results but none match this season → skip
         elif _output_cache.get(aid, {}).get(season) is not None:
             # Already classified in a previous run — reuse without hitting API
             games = _output_cache[aid][season]
             from_cache += 1
-            if games:
-                key = state_key_fn(row) if state_key_fn else ""
-                season_rows.append(
-                    (key, build_out_row(row, "; ".join(sorted(games)), out_fields)))
+            if games:   # build_output_cache() already stored the list sorted
+                season_rows.append((key, build_out_row(row, "; ".join(games))))
             # else: was scraped before and confirmed no games this season → skip
         else:
-            needs_scrape.append(row)
+            needs_scrape.append((key, row))
 
     if from_cache:
         print(f"  {from_cache} athletes resolved from output cache (no API call)")
-    if not needs_scrape:
+    if needs_scrape:
+        print(f"  {len(needs_scrape)} athletes not in results.csv – queued for scraping")
+    else:
         print(f"  No athletes required API scraping for {season}.")
-        return season_rows, no_match_rows
+    return season_rows, needs_scrape
 
-    if needs_scrape:
-        total = len(needs_scrape)
-        print(f"  {total} athletes not in results.csv – scraping olympedia.org …")
-        for i, row in enumerate(needs_scrape, 1):
-            aid       = str(row.get("athlete_id", "")).strip()
-            used_name = row.get("Used name", "")
-            print(f"  [{i}/{total}] {aid} ({used_name}) …", end=" ", flush=True)
 
+async def scrape_missing(session: aiohttp.ClientSession, rows: list[dict]) -> None:
+    """
+    Scrape every distinct athlete in rows exactly once into _scraped. Each
+    athlete page yields both seasons, so one pass serves all four plans.
+    """
+    jobs: dict[str, dict] = {}
+    for row in rows:
+        jobs.setdefault(_scrape_key(row), row)
+    # no athlete_id and no searchable name: the scrape can only fail, so skip it
+    hopeless = [key for key, row in jobs.items()
+                if key.startswith("name:") and not _search_query(row.get("Used name", ""))]
+    for key in hopeless:
+        _scraped[key] = None
+        del jobs[key]
+    if hopeless:
+        print(f"\n  {len(hopeless)} athletes have no athlete_id or searchable name – no-match")
+    if not jobs:
+        return
+
+    total = len(jobs)
+    print(f"\nScraping olympedia.org for {total} athletes not in results.csv …")
+    sem  = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    done = 0
+
+    async def bounded_scrape(key: str, row: dict) -> None:
+        nonlocal done
+        aid       = str(row.get("athlete_id", "")).strip()
+        used_name = row.get("Used name", "")
+        async with sem:
             if aid:
-                games = games_from_page(aid, season)
+                seasons = await scrape_all_seasons(session, aid)
             else:
-                games = search_and_find_season(used_name, season)
-
-            if games is None:
-                print("FAILED – adding to no-match")
-                no_match_rows.append(build_out_row(row, "", out_fields))
-            elif games:
-                print(f"{season.upper()}: {', '.join(games)}")
-                key = state_key_fn(row) if state_key_fn else ""
-                season_rows.append(
-                    (key, build_out_row(row, "; ".join(sorted(games)), out_fields)))
-            else:
-                print(f"not {season.lower()}")
+                seasons = await search_and_find_seasons(session, used_name)
+        _scraped[key] = seasons
+        done += 1
+        if seasons is None:
+            status = "FAILED – adding to no-match"
+        else:
+            status = "; ".join(f"{s.upper()}: {', '.join(games)}"
+                               for s, games in seasons.items() if games)
+            status = status or "no Winter or Summer games"
+        print(f"  [{done}/{total}] {aid} ({used_name}) … {status}")
 
+    await asyncio.gather(*(bounded_scrape(key, row) for key, row in jobs.items()))
+
+
+def materialize(needs_scrape: list[tuple[str, dict]], out_fields: list[str],
+                season: str) -> tuple[list, list]:
+    """Turn a plan's needs_scrape pairs into (season_rows, no_match_rows) from _scraped."""
+    build_out_row = out_row_builder(out_fields)
+    season_rows   = []   # (key, out_row)
+    no_match_rows = []   # out_row
+    for key, row in needs_scrape:
+        seasons = _scraped.get(_scrape_key(row))
+        if seasons is None:
+            no_match_rows.append(build_out_row(row, ""))
+        elif seasons[season]:
+            season_rows.append((key, build_out_row(row, "; ".join(seasons[season]))))
     return season_rows, no_match_rows
 
-def load_csv(path: str) -> tuple[list[str], list[dict]]:
-    with open(path, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        rows   = list(reader)
-        return list(reader.fieldnames or []), rows  # fieldnames already consumed
 
-# Re-open to get fieldnames properly
-def load_csv2(path: str):
+def load_csv(path: str) -> tuple[list[str], list[dict]]:
+    """Return (fieldnames, rows) in a single pass over the file."""
     with open(path, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames or [])
-        rows = list(reader)
+        reader     = csv.reader(f)
+        fieldnames = next(reader, [])
+        blank      = [""] * len(fieldnames)   # pads short rows so every column is present
+        rows       = [dict(zip(fieldnames, r + blank)) for r in reader if r]
     return fieldnames, rows
 
 
 print("Loading source CSVs …")
-all_states_fields, all_states_athletes = load_csv2(
+all_states_fields, all_states_athletes = load_csv(
     os.path.join(OUTPUT_DIR, "all-states.csv"))
-elsewhere_fields, elsewhere_athletes   = load_csv2(
+elsewhere_fields, elsewhere_athletes   = load_csv(
     os.path.join(OUTPUT_DIR, "us-born-elsewhere.csv"))
 
+# both files are written by olympians-by-state.py with the same columns, which
+# lets every output row share one tuple layout
+if elsewhere_fields != all_states_fields:
+    sys.exit("ERROR: all-states.csv and us-born-elsewhere.csv have different "
+             "columns – re-run olympians-by-state.py.")
 out_fields = make_out_fields(all_states_fields)
 
 # extract born state for grouping (reuse the same regex as olympians-by-state)
 _BORN_RE = re.compile(r",\s*([^,]+?)\s*\(([A-Z]+)\)\s*$")
 
-def born_state(row: dict) -> str:
-    born = row.get("Born", "")
-    m    = _BORN_RE.search(born)
+@lru_cache(maxsize=None)
+def _state_from_born(born: str) -> str:
+    # _BORN_RE can only match a string ending in ")" – skip the regex otherwise
+    if not born.rstrip().endswith(")"):
+        return "Unknown"
+    m = _BORN_RE.search(born)
     return m.group(1).strip() if m else "Unknown"
 
+
+def born_state(row: dict) -> str:
+    # memoised on the Born string: every athlete is planned once per season
+    return _state_from_born(row.get("Born", ""))
+
+def csv_text(rows: list[tuple], fields: list, header: bool = False) -> str:
+    """Serialise out-row tuples (already aligned with fields) to CSV text."""
+    buf    = io.StringIO()
+    writer = csv.writer(buf)
+    if header:
+        writer.writerow(fields)
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
 def write_csv(path: str, rows: list, fields: list):
     with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(rows)
+        f.write(csv_text(rows, fields, header=True))
 
 
 def write_season_output(season: str, out_dir: str, lookup: dict,
                         states_rows: list, elsewhere_rows: list,
-                        no_match_all: list, out_fields: list,
-                        elsewhere_fields: list):
-    """Write all output files for one season into out_dir."""
+                        no_match_all: list, out_fields: list) -> str:
+    """
+    Write all output files for one season into out_dir. Progress and summary
+    lines are collected and returned rather than printed, so both seasons can
+    be written concurrently without their output interleaving.
+    """
+    log = io.StringIO()
     os.makedirs(os.path.join(out_dir, "by-state"), exist_ok=True)
 
     # group by state
@@ -395,98 +594,105 @@ def write_season_output(season: str, out_dir: str, lookup: dict,
     for key, row in states_rows:
         state_season[key].append(row)
 
+    # one sorted pass emits count.csv, the by-state files and all-states.csv;
+    # each state's rows are serialised once and that text goes to both files
+    header     = csv_text([], out_fields, header=True)
+    all_season: list = []
+    state_counts: list[tuple[str, int]] = []
     count_path = os.path.join(out_dir, "count.csv")
-    with open(count_path, "w", encoding="utf-8", newline="") as f:
+    all_path   = os.path.join(out_dir, "all-states.csv")
+    with open(count_path, "w", encoding="utf-8", newline="") as f, \
+         open(all_path, "w", encoding="utf-8", newline="") as all_f:
         writer = csv.writer(f)
         writer.writerow(["state", "number"])
+        all_f.write(header)
         for state in sorted(states_list):
-            n = len(state_season.get(state, []))
-            if n > 0:
-                writer.writerow([state, n])
-    print(f"  Wrote {count_path}")
-
-    for state in sorted(states_list):
-        rows = state_season.get(state, [])
-        if not rows:
-            continue
-        safe_name = state.replace("/", "-")
-        out_path  = os.path.join(out_dir, "by-state", f"{safe_name}.csv")
-        write_csv(out_path, rows, out_fields)
-        print(f"    Wrote {out_path}  ({len(rows)} athletes)")
-
-    all_season = []
-    for state in sorted(states_list):
-        all_season.extend(state_season.get(state, []))
-    all_path = os.path.join(out_dir, "all-states.csv")
-    write_csv(all_path, all_season, out_fields)
-    print(f"  Wrote {all_path}  ({len(all_season)} athletes)")
+            rows = state_season.get(state)
+            if not rows:
+                continue
+            writer.writerow([state, len(rows)])
+            state_counts.append((state, len(rows)))
+            body      = csv_text(rows, out_fields)
+            safe_name = state.replace("/", "-")
+            out_path  = os.path.join(out_dir, "by-state", f"{safe_name}.csv")
+            with open(out_path, "w", encoding="utf-8", newline="") as sf:
+                sf.write(header)
+                sf.write(body)
+            print(f"    Wrote {out_path}  ({len(rows)} athletes)", file=log)
+            all_f.write(body)
+            all_season.extend(rows)
+    print(f"  Wrote {count_path}", file=log)
+    print(f"  Wrote {all_path}  ({len(all_season)} athletes)", file=log)
 
     elsewhere_out  = [row for _, row in elsewhere_rows]
     elsewhere_path = os.path.join(out_dir, "us-born-elsewhere.csv")
-    write_csv(elsewhere_path, elsewhere_out, make_out_fields(elsewhere_fields))
-    print(f"  Wrote {elsewhere_path}  ({len(elsewhere_out)} athletes)")
+    write_csv(elsewhere_path, elsewhere_out, out_fields)
+    print(f"  Wrote {elsewhere_path}  ({len(elsewhere_out)} athletes)", file=log)
 
     no_match_path = os.path.join(out_dir, "no-match.csv")
     write_csv(no_match_path, no_match_all, out_fields)
-    print(f"  Wrote {no_match_path}  ({len(no_match_all)} athletes)")
+    print(f"  Wrote {no_match_path}  ({len(no_match_all)} athletes)", file=log)
 
     label = season.lower()
-    print(f"\n--- {season} Summary ---")
-    print(f"States with ≥1 {label} athlete  : {sum(1 for s in states_list if state_season.get(s))}")
-    print(f"Total {label} / state-born      : {len(all_season)}")
-    print(f"{season} / US NOC born elsewhere : {len(elsewhere_out)}")
-    print(f"No-match (scrape needed/failed) : {len(no_match_all)}")
-    print(f"\n{season} athletes per state:")
-    for state in sorted(states_list):
-        n = len(state_season.get(state, []))
-        if n:
-            print(f"  {state:<20} {n}")
-
-    return all_season, elsewhere_out
-
-
-# ── Winter ────────────────────────────────────────────────────────────────────
-print("\nClassifying Winter – US state-born athletes …")
-winter_rows, no_match_rows = classify_athletes(
-    all_states_athletes, out_fields, season="Winter", lookup=winter_lookup,
-    state_key_fn=born_state)
-
-print("\nClassifying Winter – US-NOC / born-elsewhere athletes …")
-winter_elsewhere, no_match_elsewhere = classify_athletes(
-    elsewhere_athletes, out_fields, season="Winter", lookup=winter_lookup,
-    state_key_fn=None)
-
-print("\nWriting Winter output …")
-write_season_output(
-    season="Winter",
-    out_dir=WINTER_DIR,
-    lookup=winter_lookup,
-    states_rows=winter_rows,
-    elsewhere_rows=winter_elsewhere,
-    no_match_all=no_match_rows + no_match_elsewhere,
-    out_fields=out_fields,
-    elsewhere_fields=elsewhere_fields,
-)
-
-# ── Summer ────────────────────────────────────────────────────────────────────
-print("\nClassifying Summer – US state-born athletes …")
-summer_rows, no_match_rows_s = classify_athletes(
-    all_states_athletes, out_fields, season="Summer", lookup=summer_lookup,
-    state_key_fn=born_state)
-
-print("\nClassifying Summer – US-NOC / born-elsewhere athletes …")
-summer_elsewhere, no_match_elsewhere_s = classify_athletes(
-    elsewhere_athletes, out_fields, season="Summer", lookup=summer_lookup,
-    state_key_fn=None)
-
-print("\nWriting Summer output …")
-write_season_output(
-    season="Summer",
-    out_dir=SUMMER_DIR,
-    lookup=summer_lookup,
-    states_rows=summer_rows,
-    elsewhere_rows=summer_elsewhere,
-    no_match_all=no_match_rows_s + no_match_elsewhere_s,
-    out_fields=out_fields,
-    elsewhere_fields=elsewhere_fields,
-)
+    print(f"\n--- {season} Summary ---", file=log)
+    print(f"States with ≥1 {label} athlete  : {len(state_counts)}", file=log)
+    print(f"Total {label} / state-born      : {len(all_season)}", file=log)
+    print(f"{season} / US NOC born elsewhere : {len(elsewhere_out)}", file=log)
+    print(f"No-match (scrape needed/failed) : {len(no_match_all)}", file=log)
+    print(f"\n{season} athletes per state:", file=log)
+    for state, n in state_counts:
+        print(f"  {state:<20} {n}", file=log)
+
+    return log.getvalue()
+
+
+async def main():
+    # plan all four passes first, so each athlete is scraped at most once
+    plans: dict[tuple[str, str], tuple[list, list]] = {}
+    for season, lookup in (("Winter", winter_lookup), ("Summer", summer_lookup)):
+        print(f"\nClassifying {season} – US state-born athletes …")
+        plans[season, "states"] = plan_athletes(
+            all_states_athletes, out_fields, season=season, lookup=lookup,
+            state_key_fn=born_state)
+
+        print(f"\nClassifying {season} – US-NOC / born-elsewhere athletes …")
+        plans[season, "elsewhere"] = plan_athletes(
+            elsewhere_athletes, out_fields, season=season, lookup=lookup,
+            state_key_fn=None)
+
+    # one keep-alive pool for the whole run: connections (and their TLS sessions)
+    # are reused across requests, sized to the number of scrapes in flight
+    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY,
+                                     keepalive_timeout=30, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        await scrape_missing(
+            session, [row for _, needs_scrape in plans.values() for _, row in needs_scrape])
+
+    jobs = []
+    for season, out_dir, lookup in (("Winter", WINTER_DIR, winter_lookup),
+                                    ("Summer", SUMMER_DIR, summer_lookup)):
+        states_rows, states_scrape       = plans[season, "states"]
+        elsewhere_rows, elsewhere_scrape = plans[season, "elsewhere"]
+        scraped_states, no_match_rows         = materialize(states_scrape, out_fields, season)
+        scraped_elsewhere, no_match_elsewhere = materialize(elsewhere_scrape, out_fields, season)
+        jobs.append(dict(
+            season=season,
+            out_dir=out_dir,
+            lookup=lookup,
+            states_rows=states_rows + scraped_states,
+            elsewhere_rows=elsewhere_rows + scraped_elsewhere,
+            no_match_all=no_match_rows + no_match_elsewhere,
+            out_fields=out_fields,
+        ))
+
+    # the seasons write to disjoint directories, so both run at once; their
+    # logs are printed afterwards in Winter, Summer order
+    print("\nWriting Winter and Summer output …")
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        reports = list(pool.map(lambda job: write_season_output(**job), jobs))
+    for job, report in zip(jobs, reports):
+        print(f"\n{job['season']} output:")
+        print(report, end="")
+
+
+asyncio.run(main())
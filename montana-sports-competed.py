@@ -1,6 +1,8 @@
 import csv
 import os
 
+import pandas as pd
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_DIR  = os.path.join(SCRIPT_DIR, "input-data")
 STATE_CSV  = os.path.join(SCRIPT_DIR, "output-data", "by-state", "Montana.csv")
@@ -13,8 +15,10 @@ OUT_FIELDS = ["Games", "Event", "Team", "Pos", "Medal", "As",
 # MT athlete IDs
 montana_ids: set[str] = set()
 with open(STATE_CSV, encoding="utf-8", newline="") as f:
-    for row in csv.DictReader(f):
-        aid = str(row.get("athlete_id", "")).strip()
+    reader = csv.reader(f)
+    aid_ix = next(reader).index("athlete_id")
+    for row in reader:
+        aid = row[aid_ix].strip() if len(row) > aid_ix else ""
         if aid:
             montana_ids.add(aid)
 
@@ -25,27 +29,27 @@ results_files = [
     os.path.join(INPUT_DIR, "2024-2026-us-results.csv"),
 ]
 
-matched_rows: list[dict] = []
+# semi-join: pandas parses each file in C and only rows for Montana athletes
+# are kept; columns a file lacks (e.g. "Unnamed: 7") come out empty
+frames: list[pd.DataFrame] = []
 
 for path in results_files:
     if not os.path.exists(path):
         print(f"[WARN] not found, skipping: {path}")
         continue
-    with open(path, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            aid = str(row.get("athlete_id", "")).strip()
-            if aid in montana_ids:
-                out_row = {field: row.get(field, "") for field in OUT_FIELDS}
-                matched_rows.append(out_row)
+    df = pd.read_csv(path, dtype=str, keep_default_na=False,
+                     usecols=lambda col: col in OUT_FIELDS)
+    df = df[df["athlete_id"].str.strip().isin(montana_ids)]
+    frames.append(df.reindex(columns=OUT_FIELDS, fill_value=""))
     print(f"  Scanned {path}")
 
-print(f"Total matching rows: {len(matched_rows)}")
+matched = pd.concat(frames) if frames else pd.DataFrame(columns=OUT_FIELDS)
+print(f"Total matching rows: {len(matched)}")
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 with open(OUTPUT_CSV, "w", encoding="utf-8", newline="") as f:
-    writer = csv.DictWriter(f, fieldnames=OUT_FIELDS)
-    writer.writeheader()
-    writer.writerows(matched_rows)
+    writer = csv.writer(f)
+    writer.writerow(OUT_FIELDS)
+    writer.writerows(matched.itertuples(index=False, name=None))
 
 print(f"Written to {OUTPUT_CSV}")
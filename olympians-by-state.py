@@ -1,13 +1,23 @@
 import csv
 import os
+import pickle
 import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_DIR = os.path.join(SCRIPT_DIR, "input-data")
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "output-data")
+STATES_PATH = os.path.join(INPUT_DIR, "states-list.txt")
+BIOS_CACHE = os.path.join(INPUT_DIR, ".bios-merged.pickle")   # categorized athletes from the last run
+WRITE_WORKERS = 8   # threads writing the by-state files concurrently
 
-with open(os.path.join(INPUT_DIR, "states-list.txt"), encoding="utf-8") as f:
+# low-cardinality columns repeated across the kept rows (a few dozen distinct
+# values each); interning shares one string per value, in memory and in the cache
+INTERN_COLS = ("Roles", "Sex", "NOC", "Nationality", "Title(s)", "Name order")
+
+with open(STATES_PATH, encoding="utf-8") as f:
     states_list = [line.strip() for line in f if line.strip()]
 
 states_set = set(states_list)
@@ -29,40 +39,6 @@ def parse_born(born_str: str):
     return None, None
 
 
-# load bios.csv and 2024-2026-us-bios.csv, merging and deduplicating by athlete_id
-
-def load_bios(path: str) -> tuple[list, list[str]]:
-    with open(path, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames or [])
-        rows = list(reader)
-    return rows, fieldnames
-
-
-bios_rows, fieldnames = load_bios(os.path.join(INPUT_DIR, "bios.csv"))
-
-new_bios_path = os.path.join(INPUT_DIR, "2024-2026-us-bios.csv")
-if os.path.exists(new_bios_path):
-    new_rows, new_fields = load_bios(new_bios_path)
-    # merge fieldnames (preserve order, append any new columns)
-    for col in new_fields:
-        if col not in fieldnames:
-            fieldnames.append(col)
-    # deduplicate: index existing rows by athlete_id, then add new ones not yet seen
-    seen_ids: set[str] = {str(r.get("athlete_id", "")) for r in bios_rows}
-    added = 0
-    for row in new_rows:
-        aid = str(row.get("athlete_id", ""))
-        if aid and aid not in seen_ids:
-            bios_rows.append(row)
-            seen_ids.add(aid)
-            added += 1
-    print(f"Loaded {new_bios_path}: {len(new_rows)} rows, {added} new athletes merged.")
-else:
-    print(f"[INFO] {new_bios_path} not found – using bios.csv only.")
-
-athletes = bios_rows
-
 # categorize athletes
 
 # state name  →  list of athlete rows born in that state
@@ -71,21 +47,126 @@ state_athletes: dict[str, list] = defaultdict(list)
 # athletes whose NOC contains "United States" but NOT born in a US state
 us_noc_born_elsewhere: list = []
 
-for athlete in athletes:
-    born = athlete.get("Born", "")
-    noc = athlete.get("NOC", "")
 
-    state, country = parse_born(born)
+def categorize(born: str, noc: str) -> tuple[str | None, bool]:
+    """
+    Return (state, born_elsewhere): the US state the athlete was born in (or
+    None), and whether they are a US-NOC athlete born outside the US states.
+    """
+    # only "…, State (USA)" can be state-born – skip the regex for everything else
+    if born.rstrip().endswith("(USA)"):
+        state, country = parse_born(born)
+    else:
+        state, country = None, None
     is_us_state_born = country == "USA" and state in states_set
 
-    if is_us_state_born:
-        state_athletes[state].append(athlete)
-
     # NOC field can hold multiple space-separated country names
     # (e.g. "People's Republic of China United States")
     # we check for the whole token "United States" as a substring.
-    if "United States" in noc and not is_us_state_born:
-        us_noc_born_elsewhere.append(athlete)
+    return (state if is_us_state_born else None,
+            "United States" in noc and not is_us_state_born)
+
+
+# stream bios.csv and 2024-2026-us-bios.csv, merging and deduplicating by athlete_id.
+# rows are categorized as they are read, so only US athletes are ever kept in memory.
+
+seen_ids: set[str] = set()
+
+
+def load_bios(path: str, new_only: bool = False) -> tuple[list[str], int, int]:
+    """
+    Categorize every row of path as it is read, recording its athlete_id.
+    Rows are scanned as plain lists by column index; only the US athletes that
+    are kept get turned into dicts.
+    With new_only, rows whose athlete_id is empty or already seen are skipped.
+    Returns (fieldnames, rows read, rows merged).
+    """
+    read = kept = 0
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        width = len(fieldnames)
+        aid_ix, born_ix, noc_ix = (fieldnames.index(col) for col in ("athlete_id", "Born", "NOC"))
+        intern_ix = [fieldnames.index(col) for col in INTERN_COLS if col in fieldnames]
+        for row in reader:
+            if not row:
+                continue   # blank line – DictReader skipped these too
+            read += 1
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            aid = row[aid_ix]
+            if new_only and (not aid or aid in seen_ids):
+                continue
+            seen_ids.add(aid)
+            kept += 1
+            state, born_elsewhere = categorize(row[born_ix], row[noc_ix])
+            if not (state or born_elsewhere):
+                continue
+            for ix in intern_ix:
+                row[ix] = sys.intern(row[ix])
+            athlete = dict(zip(fieldnames, row))
+            if state:
+                state_athletes[state].append(athlete)
+            else:
+                us_noc_born_elsewhere.append(athlete)
+    return fieldnames, read, kept
+
+
+# the categorized US athletes are cached between runs, keyed on every input
+# that feeds them (and this script), so unchanged inputs skip the bios parse
+
+def input_stamp(paths: list[str]) -> list[tuple[str, int, int]]:
+    stamp = []
+    for path in paths:
+        if os.path.exists(path):
+            st = os.stat(path)
+            stamp.append((path, st.st_mtime_ns, st.st_size))
+    return stamp
+
+
+def read_bios_cache(stamp: list) -> tuple | None:
+    try:
+        with open(BIOS_CACHE, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    return data if cached_stamp == stamp else None
+
+
+def write_bios_cache(stamp: list, data: tuple) -> None:
+    tmp = f"{BIOS_CACHE}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, BIOS_CACHE)   # atomic, so an interrupted run never leaves a torn cache
+
+
+bios_path = os.path.join(INPUT_DIR, "bios.csv")
+new_bios_path = os.path.join(INPUT_DIR, "2024-2026-us-bios.csv")
+stamp = input_stamp([bios_path, new_bios_path, STATES_PATH, os.path.abspath(__file__)])
+
+cached = read_bios_cache(stamp)
+if cached is not None:
+    fieldnames, new_stats, cached_states, cached_elsewhere = cached
+    state_athletes.update(cached_states)
+    us_noc_born_elsewhere.extend(cached_elsewhere)
+    print(f"Using categorized athletes cached in {BIOS_CACHE}")
+else:
+    fieldnames, _, _ = load_bios(bios_path)
+    new_stats = None
+    if os.path.exists(new_bios_path):
+        new_fields, new_count, added = load_bios(new_bios_path, new_only=True)
+        # merge fieldnames (preserve order, append any new columns)
+        for col in new_fields:
+            if col not in fieldnames:
+                fieldnames.append(col)
+        new_stats = (new_count, added)
+    write_bios_cache(stamp, (fieldnames, new_stats, dict(state_athletes), us_noc_born_elsewhere))
+
+if new_stats is not None:
+    new_count, added = new_stats
+    print(f"Loaded {new_bios_path}: {new_count} rows, {added} new athletes merged.")
+else:
+    print(f"[INFO] {new_bios_path} not found – using bios.csv only.")
 
 # write output files
 
@@ -93,34 +174,46 @@ os.makedirs(os.path.join(OUTPUT_DIR, "by-state"), exist_ok=True)
 
 
 def write_csv(path: str, rows: list, fields):
+    # plain csv.writer over tuples; missing columns become "" as with DictWriter
+    fields = tuple(fields)
     with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows([tuple(row.get(k, "") for k in fields) for row in rows])
 
 
+# one sorted pass gives count.csv, the all-states rows and the summary counts
+state_counts: list[tuple[str, int]] = []
+all_us_athletes = []
+for state in sorted(states_list):
+    rows = state_athletes.get(state)
+    if rows:
+        state_counts.append((state, len(rows)))
+        all_us_athletes.extend(rows)
+
 count_path = os.path.join(OUTPUT_DIR, "count.csv")
 with open(count_path, "w", encoding="utf-8", newline="") as f:
     writer = csv.writer(f)
     writer.writerow(["state", "number"])
-    for state in sorted(states_list):
-        count = len(state_athletes.get(state, []))
-        if count > 0:
-            writer.writerow([state, count])
+    writer.writerows(state_counts)
 
 print(f"Wrote {count_path}")
 
-for state, rows in state_athletes.items():
+
+def write_state(state: str, rows: list) -> str:
     # use the state name directly as the filename (macOS/Linux handle spaces fine).
     # replace any characters that could be problematic on some filesystems.
     safe_name = state.replace("/", "-")
     out_path = os.path.join(OUTPUT_DIR, "by-state", f"{safe_name}.csv")
     write_csv(out_path, rows, fieldnames)
-    print(f"  Wrote {out_path}  ({len(rows)} athletes)")
+    return out_path
 
-all_us_athletes = []
-for state in sorted(states_list):
-    all_us_athletes.extend(state_athletes.get(state, []))
+
+# the files are independent, so write them in parallel; map() keeps the log in order
+with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+    paths = pool.map(write_state, state_athletes.keys(), state_athletes.values())
+    for out_path, rows in zip(paths, state_athletes.values()):
+        print(f"  Wrote {out_path}  ({len(rows)} athletes)")
 
 all_states_path = os.path.join(OUTPUT_DIR, "all-states.csv")
 write_csv(all_states_path, all_us_athletes, fieldnames)
@@ -136,7 +229,5 @@ print(f"States with at least 1 athlete : {len(state_athletes)}")
 print(f"Total US state-born athletes   : {len(all_us_athletes)}")
 print(f"US NOC / born elsewhere         : {len(us_noc_born_elsewhere)}")
 print("\nAthletes per state:")
-for state in sorted(states_list):
-    n = len(state_athletes.get(state, []))
-    if n:
-        print(f"  {state:<20} {n}")
+for state, n in state_counts:
+    print(f"  {state:<20} {n}")
@@ -35,97 +35,60 @@ pop_total = sum(population.values())
 total_winter = sum(winter.values())
 total_summer = sum(summer.values())
 
-# --- winter-count.csv ---
-with open(os.path.join(OUT_DIR, "winter-count.csv"), "w", encoding="utf-8", newline="") as f:
-    w = csv.writer(f)
-    w.writerow(["state", "per100kResidents"])
-    for state in all_states:
-        if state not in winter:
-            continue
-        pop = population.get(state)
-        if pop is None:
-            print(f"[WARN] no census data for '{state}' — skipping")
-            continue
-        w.writerow([state, per_100k(winter[state], pop)])
-    # United States aggregate
-    if pop_total > 0:
-        w.writerow(["United States", per_100k(total_winter, pop_total)])
-
-# --- summer-count.csv ---
-with open(os.path.join(OUT_DIR, "summer-count.csv"), "w", encoding="utf-8", newline="") as f:
-    w = csv.writer(f)
-    w.writerow(["state", "per100kResidents"])
-    for state in all_states:
-        if state not in summer:
-            continue
-        pop = population.get(state)
-        if pop is None:
-            print(f"[WARN] no census data for '{state}' — skipping")
-            continue
-        w.writerow([state, per_100k(summer[state], pop)])
-    # United States aggregate
-    if pop_total > 0:
-        w.writerow(["United States", per_100k(total_summer, pop_total)])
-
-# --- combined-count.csv ---
-with open(os.path.join(OUT_DIR, "combined-count.csv"), "w", encoding="utf-8", newline="") as f:
-    w = csv.writer(f)
-    w.writerow(["state", "winterPer100kResidents", "summerPer100kResidents"])
-    for state in all_states:
-        pop = population.get(state)
-        if pop is None:
-            print(f"[WARN] no census data for '{state}' — skipping")
-            continue
-        winter_val = per_100k(winter.get(state, 0), pop)
-        summer_val = per_100k(summer.get(state, 0), pop)
-        w.writerow([state, winter_val, summer_val])
-    # United States aggregate
-    if pop_total > 0:
-        w.writerow(["United States", per_100k(total_winter, pop_total), per_100k(total_summer, pop_total)])
-
-# --- overall-count.csv ---
-with open(os.path.join(OUT_DIR, "overall-count.csv"), "w", encoding="utf-8", newline="") as f:
-    w = csv.writer(f)
-    w.writerow(["state", "per100kResidents"])
-    for state in all_states:
-        pop = population.get(state)
-        if pop is None:
-            print(f"[WARN] no census data for '{state}' — skipping")
-            continue
-        total = winter.get(state, 0) + summer.get(state, 0)
-        w.writerow([state, per_100k(total, pop)])
-    # United States aggregate (total = winter + summer)
-    if pop_total > 0:
-        w.writerow(["United States", per_100k(total_winter + total_summer, pop_total)])
-
-print(f"Wrote {len(all_states)} states to {OUT_DIR}/")
-
-# --- mergedTop10.csv: top 10 states by overall per100kResidents + US averages ---
-merged_path = os.path.join(OUT_DIR, "mergedTop10.csv")
+# one pass over the states: (state, winter, summer, overall) per 100k residents,
+# shared by every output file below
 rows = []
 for state in all_states:
     pop = population.get(state)
     if pop is None:
+        print(f"[WARN] no census data for '{state}' — skipping")
         continue
-    winter_val = per_100k(winter.get(state, 0), pop)
-    summer_val = per_100k(summer.get(state, 0), pop)
-    overall = per_100k(winter.get(state, 0) + summer.get(state, 0), pop)
-    rows.append((state, winter_val, summer_val, overall))
+    w_count = winter.get(state, 0)
+    s_count = summer.get(state, 0)
+    rows.append((state, per_100k(w_count, pop), per_100k(s_count, pop),
+                 per_100k(w_count + s_count, pop)))
 
-# sort descending by overall and take top 10
-top10 = sorted(rows, key=lambda r: r[3], reverse=True)[:10]
-
-# US averages (as one extra row)
+# US averages (sum of census populations and counts)
 us_winter = per_100k(total_winter, pop_total) if pop_total > 0 else 0
 us_summer = per_100k(total_summer, pop_total) if pop_total > 0 else 0
 us_overall = per_100k(total_winter + total_summer, pop_total) if pop_total > 0 else 0
 
-with open(merged_path, "w", encoding="utf-8", newline="") as f:
-    w = csv.writer(f)
-    w.writerow(["state", "winterPer100kResidents", "summerPer100kResidents", "per100kResidents"])
-    for state, wv, sv, ov in top10:
-        w.writerow([state, wv, sv, ov])
-    # append US averages as final row
-    w.writerow(["United States", us_winter, us_summer, us_overall])
+
+def write_csv(name: str, header: list[str], out_rows, us_row: list | None) -> None:
+    with open(os.path.join(OUT_DIR, name), "w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(out_rows)
+        # United States aggregate
+        if us_row is not None:
+            w.writerow(["United States", *us_row])
+
+
+has_us = pop_total > 0
+write_csv("winter-count.csv", ["state", "per100kResidents"],
+          ((state, wv) for state, wv, _, _ in rows if state in winter),
+          [us_winter] if has_us else None)
+write_csv("summer-count.csv", ["state", "per100kResidents"],
+          ((state, sv) for state, _, sv, _ in rows if state in summer),
+          [us_summer] if has_us else None)
+write_csv("combined-count.csv", ["state", "winterPer100kResidents", "summerPer100kResidents"],
+          ((state, wv, sv) for state, wv, sv, _ in rows),
+          [us_winter, us_summer] if has_us else None)
+write_csv("overall-count.csv", ["state", "per100kResidents"],
+          ((state, ov) for state, _, _, ov in rows),
+          [us_overall] if has_us else None)
+
+print(f"Wrote {len(all_states)} states to {OUT_DIR}/")
+
+# --- mergedTop10.csv: top 10 states by overall per100kResidents + US averages ---
+merged_path = os.path.join(OUT_DIR, "mergedTop10.csv")
+
+# sort descending by overall and take top 10
+top10 = sorted(rows, key=lambda r: r[3], reverse=True)[:10]
+
+# append US averages as final row
+write_csv("mergedTop10.csv",
+          ["state", "winterPer100kResidents", "summerPer100kResidents", "per100kResidents"],
+          top10, [us_winter, us_summer, us_overall])
 
 print(f"Wrote merged top-10 to {merged_path}")
@@ -8,8 +8,11 @@ Outputs:
 Strategy:
   1. Scrape /countries/USA to find edition IDs for the two target games.
   2. Scrape /countries/USA/editions/{id} for each edition to collect athlete IDs.
-  3. For each unique athlete_id, scrape /athletes/{id} for bio + results.
-  4. Write the two output CSVs.
+  3. For each unique athlete_id, scrape /athletes/{id} for bio + results
+     (up to CONCURRENCY pages in flight at once).
+  4. Stream rows into the two output CSVs as each athlete completes. A re-run
+     after an interruption keeps the athletes already written and only
+     scrapes the rest (--refresh starts from scratch).
 
 Session cookie:
   Update SESSION_COOKIE if you get login redirects.
@@ -17,16 +20,28 @@ Session cookie:
   _olympedia_session=...
 """
 
+import asyncio
 import csv
+import gzip
+import hashlib
 import os
 import re
-import time
 import sys
-from io import StringIO
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from operator import itemgetter
+from typing import Callable
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml is BeautifulSoup's fastest backend; fall back to the stdlib parser without it
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -38,6 +53,12 @@ RESULTS_OUT = os.path.join(INPUT_DIR, "2024-2026-us-results.csv")
 
 BASE_URL = "https://www.olympedia.org"
 
+# Fetched pages are cached on disk (shared with filter-by-olympics.py), so
+# re-runs only hit the network for new or expired pages; --refresh ignores it
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".http-cache")
+CACHE_TTL = 30 * 24 * 3600   # seconds before a cached page is re-fetched
+REFRESH   = "--refresh" in sys.argv[1:]
+
 # Paste a fresh _olympedia_session value here if you hit login redirects
 SESSION_COOKIE = (
     "dmR1bjlha3YxaGUwamJDZkZaQ3FSNC9pRGNXZzNBUjdtUlEvV2w2MVhvaXowOGQwUnpO"
@@ -62,10 +83,23 @@ HEADERS = {
 
 TARGET_GAMES = {"2024 Summer Olympics", "2026 Winter Olympics"}
 
-# Rate limiting
-REQUEST_DELAY = 2.0
+# Rate limiting – an adaptive token bucket shared by all workers. It starts at
+# START_RATE requests/s (one per REQUEST_DELAY, the original pace), creeps up by
+# RATE_STEP after every RATE_WINDOW seconds without push-back (to MAX_RATE, the
+# same ceiling filter-by-olympics.py uses) and halves on a 429 or an exhausted
+# X-RateLimit-Remaining (to MIN_RATE)
+START_RATE    = 0.5
+MIN_RATE      = 0.25
+MAX_RATE      = 10.0
+RATE_STEP     = 0.5
+RATE_WINDOW   = 5.0    # seconds
+REQUEST_DELAY = 2.0    # first back-off after a 429 / failed request
 MAX_DELAY     = 60.0
 MAX_RETRIES   = 6
+CONCURRENCY   = 16     # athlete pages fetched at once
+# athlete pages are parsed in this many worker processes; with a single core
+# they are parsed inline, since a pool would only add pickling overhead
+PARSE_WORKERS = os.cpu_count() or 1
 
 # ── Columns matching the existing CSVs ────────────────────────────────────────
 BIO_COLS = [
@@ -78,61 +112,167 @@ RESULTS_COLS = [
     "Games", "Event", "Team", "Pos", "Medal", "As",
     "athlete_id", "NOC", "Discipline", "Nationality",
 ]
+BIO_AID_I     = BIO_COLS.index("athlete_id")
+RESULTS_AID_I = RESULTS_COLS.index("athlete_id")
+
+# ── Patterns used in the per-link / per-cell loops ────────────────────────────
+_EDITION_HREF_RE = re.compile(r"^/editions/(\d+)$")
+_ATHLETE_HREF_RE = re.compile(r"^/athletes/(\d+)$")
+_WS_RE           = re.compile(r"\s{2,}")
 
 # ── HTTP helpers ───────────────────────────────────────────────────────────────
-_session = requests.Session()
-_session.headers.update(HEADERS)
+def _retry_after(resp: aiohttp.ClientResponse, fallback: float) -> float:
+    """Seconds to wait after a 429: the server's Retry-After if numeric, else fallback."""
+    try:
+        return min(float(resp.headers.get("Retry-After", "")), MAX_DELAY)
+    except ValueError:
+        return fallback
 
-_current_delay = REQUEST_DELAY
 
+class AdaptiveLimiter:
+    """
+    Token bucket whose refill rate follows the server: additive increase once
+    per quiet RATE_WINDOW, multiplicative decrease when it pushes back. The
+    lock queues waiting workers in order, so at most one sleeps on the bucket.
+    """
 
-def fetch(url: str) -> requests.Response | None:
-    """GET with exponential back-off on 429."""
-    global _current_delay
-    delay = _current_delay
+    def __init__(self, rate: float):
+        self.rate   = rate
+        self.tokens = 1.0
+        self.last   = time.monotonic()
+        self.lock   = asyncio.Lock()
+        self.window = self.last    # start of the current push-back-free window
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                # refill, allowing at most one second's worth of burst
+                self.tokens = min(self.tokens + (now - self.last) * self.rate, max(self.rate, 1.0))
+                self.last   = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+    def update(self, resp: aiohttp.ClientResponse) -> None:
+        """Adjust the rate from a response's status and rate-limit headers."""
+        try:
+            remaining = int(resp.headers.get("X-RateLimit-Remaining", ""))
+        except ValueError:
+            remaining = None
+        now = time.monotonic()
+        if resp.status == 429 or remaining == 0:
+            self.rate   = max(self.rate / 2, MIN_RATE)
+            self.window = now
+        elif remaining is not None and remaining <= CONCURRENCY:
+            self.window = now    # close to the server's ceiling – hold the current rate
+        elif now - self.window >= RATE_WINDOW:
+            self.rate   = min(self.rate + RATE_STEP, MAX_RATE)
+            self.window = now
+
+
+LIMITER = AdaptiveLimiter(START_RATE)
+
+
+def _cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + ".html.gz")
+
+
+def _cache_get(url: str) -> bytes | None:
+    """Return the cached body for url if present and younger than CACHE_TTL."""
+    if REFRESH:
+        return None
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL:
+            return None
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cache_put(url: str, body: bytes) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(url)
+    tmp  = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)   # atomic, so an interrupted run never leaves a torn entry
+
+
+async def fetch(session: aiohttp.ClientSession, url: str) -> bytes | None:
+    """
+    GET paced by LIMITER, with exponential back-off on 429 (honouring
+    Retry-After). Returns the body. Direct (unredirected) 200 responses are
+    cached on disk, so re-runs skip the network (and the limiter).
+    """
+    cached = _cache_get(url)
+    if cached is not None:
+        return cached
+    delay = REQUEST_DELAY
     for attempt in range(1, MAX_RETRIES + 1):
-        time.sleep(delay)
+        await LIMITER.acquire()
         try:
-            resp = _session.get(url, timeout=20, allow_redirects=True)
-            if resp.status_code == 200:
-                _current_delay = REQUEST_DELAY
-                return resp
-            elif resp.status_code == 429:
-                delay = min(delay * 2, MAX_DELAY)
-                print(f"  [429] backing off {delay:.0f}s (attempt {attempt}/{MAX_RETRIES})")
-            else:
-                print(f"  [WARN] HTTP {resp.status_code} → {url}")
-                return None
-        except requests.RequestException as exc:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as resp:
+                LIMITER.update(resp)
+                if resp.status == 200:
+                    body = await resp.read()
+                    # only a direct 200 is cached: a redirected page (e.g. the
+                    # login page an expired cookie lands on) must not outlive it
+                    if not resp.history:
+                        _cache_put(url, body)
+                    return body
+                elif resp.status == 429:
+                    wait  = _retry_after(resp, delay)
+                    delay = min(delay * 2, MAX_DELAY)
+                    print(f"  [429] backing off {wait:.0f}s, rate now {LIMITER.rate:.2f}/s "
+                          f"(attempt {attempt}/{MAX_RETRIES})")
+                else:
+                    print(f"  [WARN] HTTP {resp.status} → {url}")
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
             print(f"  [WARN] request failed: {exc}")
             if attempt == MAX_RETRIES:
                 return None
+            wait  = delay
             delay = min(delay * 2, MAX_DELAY)
+        await asyncio.sleep(wait)
     return None
 
 
-def get_soup(url: str) -> BeautifulSoup | None:
-    resp = fetch(url)
-    if resp is None:
+# athlete pages only need their biodata and results tables – skip the rest of the DOM
+ONLY_TABLES = SoupStrainer("table")
+# index pages only need their edition / athlete links, so nothing else is built
+EDITION_LINKS = SoupStrainer("a", href=_EDITION_HREF_RE)
+ATHLETE_LINKS = SoupStrainer("a", href=_ATHLETE_HREF_RE)
+
+
+async def get_soup(session: aiohttp.ClientSession, url: str,
+                   parse_only: SoupStrainer | None = None) -> BeautifulSoup | None:
+    html = await fetch(session, url)
+    if html is None:
         return None
-    return BeautifulSoup(resp.content, "html.parser")
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
 
 
 # ── Step 1: find edition IDs from /countries/USA ─────────────────────────────
-def find_edition_ids(target_names: set[str]) -> dict[str, str]:
+async def find_edition_ids(session: aiohttp.ClientSession,
+                           target_names: set[str]) -> dict[str, str]:
     """
     Scrape /countries/USA and return {game_name: edition_id} for target games.
     The 'Participations by edition' table has links like
     <a href="/editions/63">2024 Summer Olympics</a>.
     """
     print("Fetching /countries/USA to discover edition IDs …")
-    page = get_soup(f"{BASE_URL}/countries/USA")
+    page = await get_soup(session, f"{BASE_URL}/countries/USA", EDITION_LINKS)
     if page is None:
         sys.exit("ERROR: could not fetch /countries/USA – check session cookie.")
 
     found: dict[str, str] = {}
     for a in page.find_all("a", href=True):
-        m = re.match(r"^/editions/(\d+)$", a["href"])
+        m = _EDITION_HREF_RE.match(a["href"])
         if m:
             text = a.get_text(strip=True)
             if text in target_names:
@@ -146,7 +286,8 @@ def find_edition_ids(target_names: set[str]) -> dict[str, str]:
 
 
 # ── Step 2: collect US athlete IDs from /countries/USA/editions/{id} ────────
-def get_us_athlete_ids(edition_id: str, game_name: str) -> list[str]:
+async def get_us_athlete_ids(session: aiohttp.ClientSession,
+                             edition_id: str, game_name: str) -> list[str]:
     """
     Scrape /countries/USA/editions/{id}.
     The results table lists every US athlete as a link like
@@ -155,21 +296,20 @@ def get_us_athlete_ids(edition_id: str, game_name: str) -> list[str]:
     """
     url = f"{BASE_URL}/countries/USA/editions/{edition_id}"
     print(f"  Fetching US athletes for {game_name} (edition {edition_id}) …")
-    page = get_soup(url)
+    page = await get_soup(session, url, ATHLETE_LINKS)
     if page is None:
         print(f"  [WARN] could not load {url}")
         return []
 
-    ids: list[str] = []
+    # dict keys dedupe in O(1) and keep first-seen order, which fixes output order
+    ids: dict[str, None] = {}
     for a in page.find_all("a", href=True):
-        m = re.match(r"^/athletes/(\d+)$", a["href"])
+        m = _ATHLETE_HREF_RE.match(a["href"])
         if m:
-            aid = m.group(1)
-            if aid not in ids:
-                ids.append(aid)
+            ids[m.group(1)] = None
 
     print(f"    → {len(ids)} unique US athlete IDs")
-    return ids
+    return list(ids)
 
 
 # ── Step 3: scrape bio for one athlete ────────────────────────────────────────
@@ -193,7 +333,7 @@ def scrape_bio(page: BeautifulSoup, athlete_id: str) -> dict:
             continue
         key = th.get_text(strip=True)
         val = td.get_text(separator=" ", strip=True)
-        val = re.sub(r"\s{2,}", " ", val).strip()
+        val = _WS_RE.sub(" ", val).strip()
         if key in bio:
             bio[key] = val
 
@@ -201,9 +341,6 @@ def scrape_bio(page: BeautifulSoup, athlete_id: str) -> dict:
 
 
 # ── Step 4: scrape results for one athlete ────────────────────────────────────
-_GAME_FILTER = re.compile(r"^(2024 Summer Olympics|2026 Winter Olympics)$")
-
-
 def scrape_results(page: BeautifulSoup, athlete_id: str) -> list[dict]:
     """
     Parse <table class="table"> on the athlete page.
@@ -221,166 +358,250 @@ def scrape_results(page: BeautifulSoup, athlete_id: str) -> list[dict]:
     if table is None:
         return []
 
+    # Drop <small> annotations (e.g. "(Olympic)") from body cells in one pass
+    # over the table instead of a find_all per cell; header cells keep theirs
+    for small in table.find_all("small"):
+        if small.find_parent("thead") is None:
+            small.decompose()
+
+    # Column headers come from the last <thead> row; data rows are the <tr>s of
+    # every <tbody> (a table may be split into several), or of the table itself
+    # when the markup has no <tbody>
+    thead     = table.find("thead", recursive=False)
+    head_rows = thead.find_all("tr") if thead is not None else []
+    col_headers: list[str] = (
+        [th.get_text(strip=True) for th in head_rows[-1].find_all("th")] if head_rows else [])
+    bodies = table.find_all("tbody", recursive=False) or [table]
+
     # Walk rows manually to get clean text
-    col_headers: list[str] = []
     cleaned_rows: list[list[str]] = []
-
-    for tr in table.find_all("tr"):
-        # thead
-        if tr.parent.name == "thead":
-            col_headers = [th.get_text(strip=True) for th in tr.find_all("th")]
-            continue
-        cells = []
-        for td in tr.find_all(["td", "th"]):
-            for small in td.find_all("small"):
-                small.decompose()
-            text = td.get_text(separator=" ", strip=True)
-            text = re.sub(r"\s{2,}", " ", text).strip()
-            cells.append(text)
-        if cells:
-            cleaned_rows.append(cells)
-
-    if not col_headers or not cleaned_rows:
-        return []
-
-    # Normalise row length to header length
-    n = len(col_headers)
-    cleaned_rows = [r[:n] + [""] * (n - len(r)) for r in cleaned_rows]
-
-    df = pd.DataFrame(cleaned_rows, columns=col_headers)
-
-    # Drop the unnamed trailing column olympedia sometimes adds
-    df.drop(columns=[""], inplace=True, errors="ignore")
-
-    if "Games" not in df.columns:
+    for body in bodies:
+        for tr in body.find_all("tr", recursive=False):
+            cells = []
+            for td in tr.find_all(["td", "th"]):
+                text = td.get_text(separator=" ", strip=True)
+                text = _WS_RE.sub(" ", text).strip()
+                cells.append(text)
+            if cells:
+                cleaned_rows.append(cells)
+
+    if not col_headers or not cleaned_rows or "Games" not in col_headers:
         return []
 
-    # Header rows have a non-empty Games cell; event rows have an empty one
-    is_header = df["Games"] != ""
-    is_event  = ~is_header
-
-    noc_col  = "NOC / Team"
-    disc_col = "Discipline (Sport) / Event"
-
-    df["_noc"]  = ""
-    df["_disc"] = ""
-
-    if noc_col in df.columns:
-        df.loc[is_header, "_noc"] = df.loc[is_header, noc_col]
-    if disc_col in df.columns:
-        df.loc[is_header, "_disc"] = df.loc[is_header, disc_col]
-
-    # Forward-fill from header rows onto following event rows
-    for col in ["Games", "_noc", "_disc", "As"]:
-        if col in df.columns:
-            df[col] = df[col].replace("", pd.NA).ffill().fillna("")
-
-    # Keep only event rows that match the target games
-    df = df[is_event].copy()
-    df = df[df["Games"].apply(lambda g: bool(_GAME_FILTER.match(str(g))))]
+    # Column positions (first occurrence wins). Every row is padded to the
+    # header length plus one spare "" slot, which absent columns point at.
+    n   = len(col_headers)
+    pos = {}
+    for i, name in enumerate(col_headers):
+        pos.setdefault(name, i)
+    games_i = pos["Games"]
+    noc_i   = pos.get("NOC / Team", n)
+    disc_i  = pos.get("Discipline (Sport) / Event", n)
+    pos_i   = pos.get("Pos", n)
+    medal_i = pos.get("Medal", n)
+    as_i    = pos.get("As", n)
+
+    # Forward-fill carries: Games/NOC/Discipline come from header rows (an
+    # empty header cell keeps the previous value); As carries from any row.
+    games = noc = disc = as_name = ""
+    out_rows: list[dict] = []
+    for cells in cleaned_rows:
+        cells = cells[:n]
+        cells += [""] * (n + 1 - len(cells))
+        as_name = cells[as_i] or as_name
+        if cells[games_i]:
+            # Header row – Games cell filled; nothing to emit
+            games = cells[games_i]
+            noc   = cells[noc_i] or noc
+            disc  = cells[disc_i] or disc
+            continue
+        # Event row – keep only those under the target games
+        if games not in TARGET_GAMES:
+            continue
+        # For team events the event-row's NOC/Team cell holds a teammate name;
+        # for individual events it's empty – either way that becomes Team.
+        out_rows.append({
+            "Games":       games,
+            "Event":       cells[disc_i],
+            "Team":        cells[noc_i],
+            "Pos":         cells[pos_i],
+            "Medal":       cells[medal_i],
+            "As":          as_name,
+            "athlete_id":  athlete_id,
+            "NOC":         noc,
+            "Discipline":  disc,
+            "Nationality": "",
+        })
 
-    if df.empty:
-        return []
+    return out_rows
 
-    # For team events the event-row's NOC/Team cell holds a teammate name;
-    # for individual events it's empty – either way that becomes Team.
-    df["Team"]       = df[noc_col] if noc_col in df.columns else ""
-    df["Event"]      = df[disc_col] if disc_col in df.columns else ""
-    df["NOC"]        = df["_noc"]
-    df["Discipline"] = df["_disc"]
-    df["Nationality"] = ""
 
-    pos_col   = "Pos"   if "Pos"   in df.columns else None
-    medal_col = "Medal" if "Medal" in df.columns else None
-    as_col    = "As"    if "As"    in df.columns else None
+def parse_athlete(html: bytes, athlete_id: str) -> tuple[dict, list[dict]]:
+    """
+    Parse one athlete page into (bio, results). Module-level so it can run
+    in a worker process: only the page bytes go in and plain dicts come out.
+    """
+    page = BeautifulSoup(html, HTML_PARSER, parse_only=ONLY_TABLES)
+    return scrape_bio(page, athlete_id), scrape_results(page, athlete_id)
 
-    out_rows: list[dict] = []
-    for _, r in df.iterrows():
-        row: dict = {col: "" for col in RESULTS_COLS}
-        row["Games"]      = str(r.get("Games", "") or "")
-        row["Event"]      = str(r.get("Event", "") or "")
-        row["Team"]       = str(r.get("Team", "") or "")
-        row["Pos"]        = str(r.get(pos_col, "") or "") if pos_col else ""
-        row["Medal"]      = str(r.get(medal_col, "") or "") if medal_col else ""
-        row["As"]         = str(r.get(as_col, "") or "") if as_col else ""
-        row["athlete_id"] = athlete_id
-        row["NOC"]        = str(r.get("NOC", "") or "")
-        row["Discipline"] = str(r.get("Discipline", "") or "")
-        row["Nationality"] = ""
-        # Scrub any pandas NA string representations
-        row = {k: "" if v in ("nan", "<NA>", "None") else v for k, v in row.items()}
-        out_rows.append(row)
 
-    return out_rows
+def read_previous_run(wanted: set[str]) -> tuple[list[list[str]], list[list[str]]]:
+    """
+    Return the (bios rows, results rows) an earlier, interrupted run already
+    wrote for athletes in `wanted`, so only the rest need scraping.
+    emit() flushes an athlete's results before its bio, so a complete bio row
+    on disk means its results are complete too; torn or orphaned rows are
+    dropped and those athletes are scraped again. --refresh starts over.
+    """
+    if REFRESH:
+        return [], []
+    try:
+        with open(BIOS_OUT, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            if next(reader, None) != BIO_COLS:
+                return [], []
+            bios = [row for row in reader
+                    if len(row) == len(BIO_COLS) and row[BIO_AID_I] in wanted]
+        done = {row[BIO_AID_I] for row in bios}
+        with open(RESULTS_OUT, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            if next(reader, None) != RESULTS_COLS:
+                return [], []
+            results = [row for row in reader
+                       if len(row) == len(RESULTS_COLS) and row[RESULTS_AID_I] in done]
+    except OSError:
+        return [], []
+    return bios, results
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
-def main():
-    # 1. Find edition IDs via /countries/USA
-    edition_ids = find_edition_ids(TARGET_GAMES)
-    if not edition_ids:
-        sys.exit(
-            "ERROR: no target editions found.\n"
-            "Check that the session cookie is valid and /countries/USA is reachable."
-        )
-
-    # 2. Collect all unique US athlete IDs across both editions
-    all_athlete_ids: list[str] = []
-    for game_name, eid in sorted(edition_ids.items()):
-        for aid in get_us_athlete_ids(eid, game_name):
-            if aid not in all_athlete_ids:
-                all_athlete_ids.append(aid)
-
-    total = len(all_athlete_ids)
-    print(f"\nTotal unique US athletes to scrape: {total}")
-    if total == 0:
-        sys.exit(
-            "No athlete IDs found. The page layout may have changed "
-            "or the session cookie is expired."
-        )
-
-    # 3. Scrape bios + results for each athlete
-    all_bios:    list[dict] = []
-    all_results: list[dict] = []
-    errors:      list[str]  = []
-
-    for i, aid in enumerate(all_athlete_ids, 1):
-        url = f"{BASE_URL}/athletes/{aid}"
-        print(f"[{i}/{total}] athlete {aid} …", end=" ", flush=True)
-
-        page = get_soup(url)
-        if page is None:
-            print("FAILED")
-            errors.append(aid)
-            continue
-
-        bio = scrape_bio(page, aid)
-        res = scrape_results(page, aid)
-        all_bios.append(bio)
-        all_results.extend(res)
-        name = bio.get("Used name", "").replace("\u2022", " ").strip()
-        print(f"ok  ({name})  {len(res)} result row(s)")
-
-    # 4. Write outputs
-    print(f"\nWriting {BIOS_OUT} …")
-    with open(BIOS_OUT, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=BIO_COLS, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(all_bios)
-
-    print(f"Writing {RESULTS_OUT} …")
-    with open(RESULTS_OUT, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=RESULTS_COLS, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(all_results)
+async def scrape_athletes(session: aiohttp.ClientSession, athlete_ids: list[str],
+                          emit: Callable[[str, tuple[dict, list[dict]] | None], None]) -> None:
+    """
+    Fetch and parse every athlete page, CONCURRENCY at a time.
+    emit(athlete_id, (bio, results) or None on failure) is called in
+    athlete_ids order as soon as an athlete and everyone before it are done,
+    so output order is stable while only the out-of-order few are held.
+    Parsing is CPU-bound, so with PARSE_WORKERS > 1 pages are handed to a
+    process pool and the event loop keeps fetching while they are parsed.
+    """
+    sem   = asyncio.Semaphore(CONCURRENCY)
+    total = len(athlete_ids)
+    loop  = asyncio.get_running_loop()
+
+    async def scrape_one(aid: str) -> tuple[str, tuple[dict, list[dict]] | None]:
+        async with sem:
+            html = await fetch(session, f"{BASE_URL}/athletes/{aid}")
+        if html is None:
+            return aid, None
+        if pool is None:
+            return aid, parse_athlete(html, aid)
+        return aid, await loop.run_in_executor(pool, parse_athlete, html, aid)
+
+    pool_ctx = ProcessPoolExecutor(PARSE_WORKERS) if PARSE_WORKERS > 1 else nullcontext()
+    with pool_ctx as pool:
+        done: dict[str, tuple[dict, list[dict]] | None] = {}   # finished, not yet emitted
+        next_i = 0
+        tasks  = [scrape_one(aid) for aid in athlete_ids]
+        for i, task in enumerate(asyncio.as_completed(tasks), 1):
+            aid, parsed = await task
+            if parsed is None:
+                print(f"[{i}/{total}] athlete {aid} … FAILED")
+            else:
+                bio, res = parsed
+                name = bio.get("Used name", "").replace("\u2022", " ").strip()
+                print(f"[{i}/{total}] athlete {aid} … ok  ({name})  {len(res)} result row(s)")
+            done[aid] = parsed
+            while next_i < total and athlete_ids[next_i] in done:
+                emit(athlete_ids[next_i], done.pop(athlete_ids[next_i]))
+                next_i += 1
+
+
+async def main():
+    # one keep-alive pool for the whole run: connections (and their TLS sessions)
+    # are reused across requests, sized to the number of fetches in flight.
+    # Retries stay in fetch(), so the connector only pools sockets.
+    connector = aiohttp.TCPConnector(limit=CONCURRENCY, limit_per_host=CONCURRENCY,
+                                     keepalive_timeout=30, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        # 1. Find edition IDs via /countries/USA
+        edition_ids = await find_edition_ids(session, TARGET_GAMES)
+        if not edition_ids:
+            sys.exit(
+                "ERROR: no target editions found.\n"
+                "Check that the session cookie is valid and /countries/USA is reachable."
+            )
+
+        # 2. Collect all unique US athlete IDs across both editions
+        editions = sorted(edition_ids.items())
+        id_lists = await asyncio.gather(
+            *(get_us_athlete_ids(session, eid, game_name) for game_name, eid in editions))
+        all_athlete_ids = list(dict.fromkeys(aid for ids in id_lists for aid in ids))
+
+        total = len(all_athlete_ids)
+        print(f"\nTotal unique US athletes to scrape: {total}")
+        if total == 0:
+            sys.exit(
+                "No athlete IDs found. The page layout may have changed "
+                "or the session cookie is expired."
+            )
+
+        # 3. Resume: athletes a previous, interrupted run already wrote out are
+        #    kept as-is and not fetched again
+        prev_bios, prev_results = read_previous_run(set(all_athlete_ids))
+        done = {row[BIO_AID_I] for row in prev_bios}
+        todo = [aid for aid in all_athlete_ids if aid not in done]
+        if done:
+            print(f"Resuming: {len(done)} athlete(s) already on disk, {len(todo)} to scrape")
+
+        # 4. Scrape bios + results for each remaining athlete, streaming both CSVs
+        #    to disk as they complete (the files are only opened once there is work
+        #    to do). Results always reach disk before their bio, so a bio row on disk
+        #    has all its results behind it – that is what a resume trusts.
+        #    The carried-over rows are rewritten through temp files swapped in with
+        #    os.replace, results first, so no file is ever truncated in place.
+        print(f"Writing {BIOS_OUT} and {RESULTS_OUT} as athletes complete …")
+        for path, header, rows in ((RESULTS_OUT, RESULTS_COLS, prev_results),
+                                   (BIOS_OUT, BIO_COLS, prev_bios)):
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(rows)
+            os.replace(tmp, path)
+        n_bios = n_results = 0
+        errors: list[str] = []
+        with open(BIOS_OUT, "a", encoding="utf-8", newline="") as bios_f, \
+             open(RESULTS_OUT, "a", encoding="utf-8", newline="") as results_f:
+            # scrape_bio / scrape_results always fill every column, so rows go out
+            # as plain tuples in column order – no per-key DictWriter lookups
+            bio_row, result_row = itemgetter(*BIO_COLS), itemgetter(*RESULTS_COLS)
+            bios_w    = csv.writer(bios_f)
+            results_w = csv.writer(results_f)
+
+            def emit(aid: str, parsed: tuple[dict, list[dict]] | None) -> None:
+                nonlocal n_bios, n_results
+                if parsed is None:
+                    errors.append(aid)
+                    return
+                bio, res = parsed
+                results_w.writerows(map(result_row, res))
+                results_f.flush()
+                bios_w.writerow(bio_row(bio))
+                bios_f.flush()
+                n_bios    += 1
+                n_results += len(res)
+
+            await scrape_athletes(session, todo, emit)
 
     print(f"\n--- Done ---")
-    print(f"Athletes scraped : {len(all_bios)}")
-    print(f"Result rows      : {len(all_results)}")
+    print(f"Athletes resumed : {len(done)}")
+    print(f"Athletes scraped : {n_bios}")
+    print(f"Result rows      : {n_results}")
     print(f"Errors           : {len(errors)}")
     if errors:
         print(f"Failed IDs: {errors}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())